@@ -20,7 +20,7 @@ from contextvars import ContextVar
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from .parser import QXDMLogParser
+from .parser import QXDMLogParser, to_datetime
 
 # --------------------------------------------------------------------------- #
 # Thresholds (single source of truth — also embedded in run_record.json so the
@@ -111,7 +111,7 @@ def evaluate_rf(parser: QXDMLogParser, thresholds: Dict = KPI_THRESHOLDS) -> Lis
             breaches += 1
             collector.record(
                 "rf_degradation",
-                timestamp=m["timestamp"],
+                timestamp=to_datetime(m["timestamp"]),
                 cell=m["cell"],
                 rf_context={"rsrp": m["rsrp"], "rsrq": m["rsrq"], "sinr": m["sinr"]},
                 rsrp_breach=rsrp_bad,
@@ -147,7 +147,7 @@ def evaluate_handovers(
             measured = parser.measured_cells_before(ho["timestamp"])
             collector.record(
                 "handover_failure",
-                timestamp=ho["timestamp"],
+                timestamp=to_datetime(ho["timestamp"]),
                 source_cell=ho["source_cell"],
                 target_cell=ho["target_cell"],
                 reestablishment_cause=ho["failure_cause"],
@@ -164,10 +164,10 @@ def evaluate_handovers(
         ):
             collector.record(
                 "slow_handover",
-                timestamp=ho["timestamp"],
+                timestamp=to_datetime(ho["timestamp"]),
                 source_cell=ho["source_cell"],
                 target_cell=ho["target_cell"],
-                duration_ms=round(ho["duration_ms"], 1),
+                duration_ms=ho["duration_ms"],
                 threshold_ms=thresholds["handover_duration_max_ms"],
                 rf_context=parser.rf_context_at(ho["timestamp"]),
             )
@@ -179,7 +179,7 @@ def evaluate_handovers(
     for pp in parser.detect_pingpong_handovers():
         collector.record(
             "handover_pingpong",
-            timestamp=pp["first_ho_ts"],
+            timestamp=to_datetime(pp["first_ho_ts"]),
             cell_a=pp["cell_a"],
             cell_b=pp["cell_b"],
             return_gap_s=round(pp["gap_s"], 1),
@@ -205,7 +205,7 @@ def evaluate_nas(parser: QXDMLogParser) -> List[str]:
     for f in parser.extract_nas_failures():
         collector.record(
             "nas_failure",
-            timestamp=f["timestamp"],
+            timestamp=to_datetime(f["timestamp"]),
             procedure=f["procedure"],
             cause_family=f["cause_family"],
             cause_code=f["cause_code"],
@@ -226,7 +226,9 @@ def evaluate_call_setup(
     violations = []
     setup_ms = parser.calculate_call_setup_time()
     if setup_ms is not None and setup_ms > thresholds["call_setup_time_max_ms"]:
-        first_event_ts = parser.events[0]["timestamp"] if parser.events else None
+        first_event_ts = (
+            to_datetime(parser.events[0]["timestamp"]) if parser.events else None
+        )
         # RRC setup precedes the first measurement report, so a lookback
         # returns nothing; use the earliest measurement as session RF context
         # so heuristics can judge whether the radio was healthy.
@@ -243,7 +245,7 @@ def evaluate_call_setup(
         collector.record(
             "slow_call_setup",
             timestamp=first_event_ts,
-            setup_time_ms=round(setup_ms, 1),
+            setup_time_ms=setup_ms,
             threshold_ms=thresholds["call_setup_time_max_ms"],
             rf_context=rf_ctx,
         )
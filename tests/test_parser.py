@@ -1,12 +1,14 @@
 """Parser tests: original 12-test coverage migrated to the package layout,
 plus coverage for the new cause-code / cell-context / ping-pong extraction."""
 
+from datetime import datetime
+
 import pytest
 
-from wireless_validation.parser import QXDMLogParser
+from wireless_validation.parser import Event, QXDMLogParser, to_datetime
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_qxdm_log():
     return """
 2026-02-03 10:15:23.456  [RRC] RRC Connection Request
@@ -22,62 +24,113 @@ def sample_qxdm_log():
 """
 
 
-class TestLogParsing:
-    def test_parser_initialization(self, sample_qxdm_log):
-        parser = QXDMLogParser(sample_qxdm_log)
-        assert len(parser.events) > 0
-        assert all("timestamp" in e for e in parser.events)
-        assert all("layer" in e for e in parser.events)
+@pytest.fixture(scope="module")
+def parsed_sample(sample_qxdm_log):
+    """Parsed once per module; tests only read from it."""
+    return QXDMLogParser(sample_qxdm_log)
+
 
-    def test_filter_by_layer(self, sample_qxdm_log):
+class TestLogParsing:
+    def test_parser_initialization(self, parsed_sample):
+        assert len(parsed_sample.events) > 0
+        assert all("timestamp" in e for e in parsed_sample.events)
+        assert all("layer" in e for e in parsed_sample.events)
+
+    def test_events_support_attribute_and_item_access(self, parsed_sample):
+        event = parsed_sample.events[0]
+        assert isinstance(event, Event)
+        assert event.layer == event["layer"] == "RRC"
+        with pytest.raises(KeyError):
+            event["cell"]
+
+    def test_timestamps_are_epoch_ms(self, parsed_sample):
+        first, second = (e["timestamp"] for e in parsed_sample.events[:2])
+        assert isinstance(first, int) and second - first == 33
+        assert to_datetime(first) == datetime(2026, 2, 3, 10, 15, 23, 456000)
+
+    def test_filter_by_layer(self, parsed_sample):
+        assert len(parsed_sample.get_events_by_layer("RRC")) == 6
+        assert len(parsed_sample.get_events_by_layer("NAS")) == 2
+
+    def test_filter_result_is_callers_copy(self, sample_qxdm_log):
         parser = QXDMLogParser(sample_qxdm_log)
+        parser.get_events_by_layer("RRC").clear()
         assert len(parser.get_events_by_layer("RRC")) == 6
-        assert len(parser.get_events_by_layer("NAS")) == 2
 
-    def test_extract_rf_measurements(self, sample_qxdm_log):
-        parser = QXDMLogParser(sample_qxdm_log)
-        measurements = parser.extract_rf_measurements()
+    def test_extract_rf_measurements(self, parsed_sample):
+        measurements = parsed_sample.extract_rf_measurements()
         assert len(measurements) == 2
         assert measurements[0]["rsrp"] == -85
         assert measurements[0]["rsrq"] == -10
         assert measurements[0]["sinr"] == 18
         assert measurements[0]["cell"] is None  # legacy format has no Cell=
 
-    def test_call_setup_time(self, sample_qxdm_log):
-        parser = QXDMLogParser(sample_qxdm_log)
-        setup = parser.calculate_call_setup_time()
+    def test_call_setup_time(self, parsed_sample):
+        setup = parsed_sample.calculate_call_setup_time()
         assert setup is not None and setup <= 2000
 
 
 class TestHandoverAnalysis:
-    def test_successful_handover_with_cells(self):
-        log = """
+    @pytest.mark.parametrize(
+        "log, expected",
+        [
+            pytest.param(
+                """
 2026-02-03 10:00:00.000  [RRC] RRC Reconfiguration (Handover Command) - Source Cell: 123
 2026-02-03 10:00:00.050  [RRC] RRC Reconfiguration Complete - Target Cell: 456
-"""
-        ho = QXDMLogParser(log).detect_handover_events()[0]
-        assert ho["success"] is True
-        assert ho["duration_ms"] == 50
-        assert ho["source_cell"] == 123 and ho["target_cell"] == 456
-        assert ho["failure_cause"] is None
-
-    def test_failed_handover_extracts_cause(self):
-        log = """
+""",
+                {
+                    "success": True,
+                    "duration_ms": 50,
+                    "source_cell": 123,
+                    "target_cell": 456,
+                    "failure_cause": None,
+                },
+                id="success_with_cells",
+            ),
+            pytest.param(
+                """
 2026-02-03 10:10:00.000  [RRC] RRC Reconfiguration (Handover Command) - Source Cell: 111 -> Target Cell: 222
 2026-02-03 10:10:02.000  [RRC] RRC Connection Re-establishment Request - Cause: handoverFailure
-"""
-        ho = QXDMLogParser(log).detect_handover_events()[0]
-        assert ho["success"] is False
-        assert ho["failure_cause"] == "handoverFailure"
-        assert ho["target_cell"] == 222  # commanded target from the HO line
-
-    def test_missing_handover_completion_is_failure(self):
-        log = """
+""",
+                {
+                    "success": False,
+                    "failure_cause": "handoverFailure",
+                    "target_cell": 222,  # commanded target from the HO line
+                },
+                id="failure_extracts_cause",
+            ),
+            pytest.param(
+                """
 2026-02-03 10:00:00.000  [RRC] RRC Reconfiguration (Handover Command) - Source Cell: 999
 2026-02-03 10:00:05.000  [RRC] Some other event
-"""
+""",
+                {"success": False, "failure_cause": None},
+                id="missing_completion_is_failure",
+            ),
+        ],
+    )
+    def test_single_handover_outcome(self, log, expected):
+        (ho,) = QXDMLogParser(log).detect_handover_events()
+        for key, value in expected.items():
+            assert ho[key] == value, key
+
+    def test_outcome_beyond_lookahead_window_is_failure(self):
+        filler = "".join(
+            f"2026-02-03 10:00:00.{i:03d}  [RRC] Some other event\n"
+            for i in range(1, 10)
+        )
+        log = (
+            "2026-02-03 10:00:00.000  [RRC] RRC Reconfiguration (Handover Command)\n"
+            + filler
+            + "2026-02-03 10:00:00.100  [RRC] RRC Reconfiguration Complete\n"
+        )
         ho = QXDMLogParser(log).detect_handover_events()[0]
-        assert ho["success"] is False and ho["failure_cause"] is None
+        assert ho["success"] is False and ho["duration_ms"] is None
+
+        # One filler event fewer puts the completion back inside the window.
+        log = log.replace("2026-02-03 10:00:00.009  [RRC] Some other event\n", "")
+        assert QXDMLogParser(log).detect_handover_events()[0]["success"] is True
 
     def test_pingpong_detection(self):
         log = """
@@ -113,6 +166,19 @@ class TestCauseCodesAndContext:
         assert failures[0]["cause_family"] == "5GMM" and failures[0]["cause_code"] == 22
         assert failures[1]["cause_family"] == "5GSM" and failures[1]["cause_code"] == 26
 
+    def test_mutating_measurements_does_not_leak_into_history(self):
+        log = """
+2026-02-03 10:00:01.000  [5G_NR] Measurement Report: RSRP=-80dBm, RSRQ=-9dB, SINR=18dB, Cell=10
+2026-02-03 10:00:05.000  [RRC] RRC Connection Release
+"""
+        parser = QXDMLogParser(log)
+        measurements = parser.extract_rf_measurements()
+        measurements[0]["cell"] = 99
+        measurements.clear()
+        when = parser.events[-1]["timestamp"]
+        assert parser.measured_cells_before(when) == {10}
+        assert parser.extract_rf_measurements()[0]["cell"] == 10
+
     def test_measured_cells_before(self):
         log = """
 2026-02-03 10:00:01.000  [5G_NR] Measurement Report: RSRP=-80dBm, RSRQ=-9dB, SINR=18dB, Cell=10
@@ -136,6 +202,30 @@ class TestEdgeCases:
     def test_empty_log(self):
         assert QXDMLogParser("").events == []
 
+    def test_call_setup_time_uses_first_completed_setup(self):
+        log = """
+2026-02-03 10:00:00.000  [RRC] RRC Connection Setup Complete
+2026-02-03 10:00:01.000  [RRC] RRC Connection Request
+2026-02-03 10:00:01.120  [RRC] RRC Connection Setup Complete
+2026-02-03 10:05:00.000  [RRC] RRC Connection Request
+2026-02-03 10:05:03.000  [RRC] RRC Connection Setup Complete
+"""
+        assert QXDMLogParser(log).calculate_call_setup_time() == 120
+
+    def test_parsing_is_deferred_until_first_use(self, sample_qxdm_log):
+        parser = QXDMLogParser(sample_qxdm_log)
+        assert "_columns" not in vars(parser)
+        assert parser.calculate_call_setup_time() == 46
+        assert "events" not in vars(parser)  # no Event rows needed for that
+
+    def test_from_bytes_matches_text_parsing(self, sample_qxdm_log):
+        raw = sample_qxdm_log.encode() + b"\xff\xfe binary junk between records\n"
+        buf = bytearray(raw)
+        parser = QXDMLogParser.from_bytes(memoryview(buf))
+        buf[:] = bytes(len(buf))  # caller reuses its buffer after construction
+        assert parser.events == QXDMLogParser(sample_qxdm_log).events
+        assert parser.calculate_call_setup_time() == 46
+
     def test_malformed_log_line(self):
         log = """
 2026-02-03 10:15:23.456  [RRC] Valid line